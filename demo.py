@@ -4,86 +4,146 @@ Quick Demo Script for Rockfall Detection System
 ==============================================
 
 This script runs a quick demonstration of all system components.
+The independent demo steps run as concurrent child processes, so the
+total runtime is bounded by the slowest step rather than their sum.
 """
 
+import asyncio
 import subprocess
 import sys
-import time
 from pathlib import Path
 
-def run_demo():
+_PROJECT_ROOT = Path(__file__).resolve().parent
+# The interpreter running this script is already the project's venv
+# interpreter when launched as documented, on every platform
+_PYTHON_EXE = sys.executable
+
+# Headline lines picked out of the DEM analysis output
+_KEY_RESULT_MARKERS = ('High risk areas:', 'Critical zones:', 'Max slope:')
+
+# With pyahocorasick installed all markers are matched in a single pass
+try:
+    import ahocorasick
+    _KEY_RESULT_AUTOMATON = ahocorasick.Automaton()
+    for _marker in _KEY_RESULT_MARKERS:
+        _KEY_RESULT_AUTOMATON.add_word(_marker, _marker)
+    _KEY_RESULT_AUTOMATON.make_automaton()
+except ImportError:
+    _KEY_RESULT_AUTOMATON = None
+
+
+def _is_key_result(line):
+    """Whether a line of DEM analysis output is one of the headline figures"""
+    if _KEY_RESULT_AUTOMATON is not None:
+        return next(_KEY_RESULT_AUTOMATON.iter(line), None) is not None
+    return any(marker in line for marker in _KEY_RESULT_MARKERS)
+
+
+async def _run(cmd, timeout, line_filter=None):
+    """Run a child process without blocking the event loop
+    
+    Stdout is discarded unless a line_filter is given, in which case it is
+    streamed line by line and only matching lines are kept.
+    """
+    proc = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdout=asyncio.subprocess.PIPE if line_filter else asyncio.subprocess.DEVNULL,
+        stderr=asyncio.subprocess.PIPE
+    )
+    
+    async def _keep_lines():
+        lines = []
+        if line_filter is not None:
+            async for raw in proc.stdout:
+                line = raw.decode(errors='replace')
+                if line_filter(line):
+                    lines.append(line.strip())
+        return lines
+    
+    async def _collect():
+        # Drain both pipes together so neither can fill up and stall the child
+        lines, stderr = await asyncio.gather(_keep_lines(), proc.stderr.read())
+        await proc.wait()
+        return lines, stderr
+    
+    try:
+        lines, stderr = await asyncio.wait_for(_collect(), timeout)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        raise subprocess.TimeoutExpired(cmd, timeout)
+    
+    return subprocess.CompletedProcess(
+        cmd, proc.returncode,
+        '\n'.join(lines),
+        stderr.decode(errors='replace')
+    )
+
+
+async def _skip(reason):
+    """Placeholder job for a demo step whose input is missing"""
+    raise FileNotFoundError(reason)
+
+
+def _report(result, label):
+    """Print the outcome of a finished demo step, returning True on success"""
+    if isinstance(result, subprocess.TimeoutExpired):
+        print(f"⏰ {label} timed out")
+    elif isinstance(result, Exception):
+        print(f"❌ Error: {result}")
+    elif result.returncode == 0:
+        print(f"✅ {label} completed successfully")
+        return True
+    else:
+        print(f"❌ {label} failed: {result.stderr}")
+    return False
+
+
+async def run_demo():
     """Run comprehensive system demo"""
     print("🏔️ Rockfall Detection System - Quick Demo")
     print("="*60)
     
-    project_root = Path(__file__).parent
-    python_exe = project_root / ".venv" / "Scripts" / "python.exe"
+    sensor_cmd = [
+        _PYTHON_EXE, "src/sensors/sensor_alerts.py",
+        "--duration", "12", "--save-plot"
+    ]
+    setup_cmd = [_PYTHON_EXE, "main.py", "--mode", "setup"]
+    
+    dem_file = _PROJECT_ROOT / "data" / "DEM" / "Bingham_Canyon_Mine.tif"
+    if dem_file.exists():
+        dem_job = _run([
+            _PYTHON_EXE, "src/dem_analysis/dem_processor.py",
+            "--dem", str(dem_file)
+        ], 120, line_filter=_is_key_result)
+    else:
+        dem_job = _skip("DEM file not found")
+    
+    print("\n⏳ Running sensor, DEM and sample data demos concurrently...")
+    sensor_result, dem_result, setup_result = await asyncio.gather(
+        _run(sensor_cmd, 60),
+        dem_job,
+        _run(setup_cmd, 60),
+        return_exceptions=True
+    )
     
     # Test 1: Sensor Analysis
     print("\n📊 Demo 1: Sensor-based Risk Analysis")
     print("-" * 40)
-    try:
-        result = subprocess.run([
-            str(python_exe), "src/sensors/sensor_alerts.py", 
-            "--duration", "12", "--save-plot"
-        ], capture_output=True, text=True, timeout=60)
-        
-        if result.returncode == 0:
-            print("✅ Sensor analysis completed successfully")
-        else:
-            print(f"❌ Sensor analysis failed: {result.stderr}")
-    except subprocess.TimeoutExpired:
-        print("⏰ Sensor analysis timed out")
-    except Exception as e:
-        print(f"❌ Error: {e}")
-    
-    time.sleep(2)
+    _report(sensor_result, "Sensor analysis")
     
     # Test 2: DEM Analysis
     print("\n🗺️ Demo 2: DEM Risk Analysis")
     print("-" * 40)
-    try:
-        dem_file = project_root / "data" / "DEM" / "Bingham_Canyon_Mine.tif"
-        if dem_file.exists():
-            result = subprocess.run([
-                str(python_exe), "src/dem_analysis/dem_processor.py", 
-                "--dem", str(dem_file)
-            ], capture_output=True, text=True, timeout=120)
-            
-            if result.returncode == 0:
-                print("✅ DEM analysis completed successfully")
-                # Print key results
-                output_lines = result.stdout.split('\n')
-                for line in output_lines:
-                    if 'High risk areas:' in line or 'Critical zones:' in line or 'Max slope:' in line:
-                        print(f"   {line.strip()}")
-            else:
-                print(f"❌ DEM analysis failed: {result.stderr}")
-        else:
-            print("❌ DEM file not found")
-    except subprocess.TimeoutExpired:
-        print("⏰ DEM analysis timed out")
-    except Exception as e:
-        print(f"❌ Error: {e}")
-    
-    time.sleep(2)
+    if _report(dem_result, "DEM analysis"):
+        # Print key results
+        for line in dem_result.stdout.splitlines():
+            print(f"   {line}")
     
     # Test 3: Create sample data
     print("\n📂 Demo 3: Creating Sample Data")
     print("-" * 40)
-    try:
-        result = subprocess.run([
-            str(python_exe), "main.py", "--mode", "setup"
-        ], capture_output=True, text=True, timeout=60)
-        
-        if result.returncode == 0:
-            print("✅ Sample data created successfully")
-        else:
-            print(f"❌ Sample data creation failed: {result.stderr}")
-    except subprocess.TimeoutExpired:
-        print("⏰ Sample data creation timed out")
-    except Exception as e:
-        print(f"❌ Error: {e}")
+    _report(setup_result, "Sample data creation")
     
     # Demo summary
     print("\n" + "="*60)
@@ -106,4 +166,4 @@ def run_demo():
     print("   python main.py --mode detect --source 0")
 
 if __name__ == "__main__":
-    run_demo()
\ No newline at end of file
+    asyncio.run(run_demo())
@@ -22,21 +22,232 @@ Usage:
 import os
 import sys
 import argparse
+import asyncio
+import atexit
+import queue
+import signal
 import subprocess
 import threading
-import time
 import json
+import mmap
+import shutil
+import multiprocessing
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
 from datetime import datetime
+from functools import cache
 from pathlib import Path
 import logging
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
-# Add src directories to path
-sys.path.append(str(Path(__file__).parent / "src"))
-sys.path.append(str(Path(__file__).parent / "src" / "training"))
-sys.path.append(str(Path(__file__).parent / "src" / "detection"))
-sys.path.append(str(Path(__file__).parent / "src" / "sensors"))
-sys.path.append(str(Path(__file__).parent / "src" / "dem_analysis"))
-sys.path.append(str(Path(__file__).parent / "src" / "dashboard"))
+_PROJECT_ROOT = Path(__file__).resolve().parent
+_SRC_DIR = _PROJECT_ROOT / "src"
+
+
+def _add_src_path(component):
+    """Put src/ and one component directory on the import path"""
+    for path in (str(_SRC_DIR), str(_SRC_DIR / component)):
+        if path not in sys.path:
+            sys.path.append(path)
+
+
+# Component loaders: each heavy module (torch, ultralytics, rasterio,
+# matplotlib) is imported only by the mode that needs it, and only once
+@cache
+def _load_trainer():
+    """Import the YOLOv8 trainer class"""
+    _add_src_path("training")
+    from src.training.train_yolo import RockfallTrainer
+    return RockfallTrainer
+
+
+@cache
+def _load_detector():
+    """Import the real-time video detector class"""
+    _add_src_path("detection")
+    from src.detection.realtime_detector import RockfallDetector
+    return RockfallDetector
+
+
+def _use_file_backend():
+    """Select matplotlib's Agg backend before pyplot is imported
+    
+    The sensor and DEM plots are only ever saved to files, and they may be
+    drawn on worker threads, where GUI backends (TkAgg, macosx) fail.
+    """
+    import matplotlib
+    matplotlib.use("Agg")
+
+
+@cache
+def _load_sensor_processor():
+    """Import the sensor data processor class"""
+    _use_file_backend()
+    _add_src_path("sensors")
+    from src.sensors.sensor_alerts import SensorDataProcessor
+    return SensorDataProcessor
+
+
+@cache
+def _load_dem_analyzer():
+    """Import the DEM analyzer class"""
+    _use_file_backend()
+    _add_src_path("dem_analysis")
+    from src.dem_analysis.dem_processor import DEMAnalyzer
+    return DEMAnalyzer
+
+# Prefer BLAKE3 for DEM content hashing when available
+try:
+    from blake3 import blake3 as _dem_hasher
+except ImportError:
+    from hashlib import sha256 as _dem_hasher
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import aiofiles
+    AIOFILES_AVAILABLE = True
+except ImportError:
+    AIOFILES_AVAILABLE = False
+
+DEM_HASH_CHUNK_SIZE = 1024 * 1024
+
+
+@cache
+def _dem_analyzer_version():
+    """Salt for DEM cache keys: a hash of the analyzer source, so algorithm
+    changes invalidate cached reports but a checkout or touch does not"""
+    try:
+        source = (_SRC_DIR / "dem_analysis" / "dem_processor.py").read_bytes()
+    except OSError:
+        return "0"
+    
+    return _dem_hasher(source).hexdigest()[:16]
+
+
+def _dem_cache_key(dem_path, min_area):
+    """Build the DEM analysis cache key from the file contents, zone size and analyzer version"""
+    hasher = _dem_hasher()
+    hasher.update(_dem_analyzer_version().encode())
+    with open(dem_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                for offset in range(0, len(view), DEM_HASH_CHUNK_SIZE):
+                    hasher.update(view[offset:offset + DEM_HASH_CHUNK_SIZE])
+    
+    return f"dem_{hasher.hexdigest()[:16]}_{min_area}"
+
+
+def _dem_fingerprint(dem_path):
+    """Cheap DEM change detector: file identity, size and mtime plus the first and last MiB
+    
+    The mtime catches same-size edits in the middle of a file, which the
+    sampled bytes would miss.
+    """
+    hasher = _dem_hasher()
+    with open(dem_path, 'rb') as f:
+        st = os.fstat(f.fileno())
+        size = st.st_size
+        hasher.update(f"{st.st_ino}:{size}:{st.st_mtime_ns}".encode())
+        hasher.update(f.read(DEM_HASH_CHUNK_SIZE))
+        if size > DEM_HASH_CHUNK_SIZE:
+            f.seek(max(size - DEM_HASH_CHUNK_SIZE, DEM_HASH_CHUNK_SIZE))
+            hasher.update(f.read())
+    
+    return hasher.hexdigest()
+
+
+def _write_json(path, data):
+    """Write data as indented JSON, stringifying values JSON can't represent"""
+    if ORJSON_AVAILABLE:
+        # numpy arrays and scalars are encoded natively, without a Python callback
+        options = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        Path(path).write_bytes(orjson.dumps(data, default=str, option=options))
+    else:
+        with open(path, 'w') as f:
+            json.dump(data, f, indent=2, default=str)
+
+
+async def _write_json_async(path, data):
+    """Write data as indented JSON without blocking the event loop"""
+    if ORJSON_AVAILABLE:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(data, indent=2).encode()
+    
+    if AIOFILES_AVAILABLE:
+        async with aiofiles.open(path, 'wb') as f:
+            await f.write(payload)
+    else:
+        await asyncio.to_thread(Path(path).write_bytes, payload)
+
+
+def _list_dems(dem_dir):
+    """List the .tif files in a directory with a single scandir pass"""
+    try:
+        with os.scandir(dem_dir) as entries:
+            return [
+                Path(entry.path) for entry in entries
+                if entry.is_file() and entry.name.lower().endswith('.tif')
+            ]
+    except FileNotFoundError:
+        return []
+
+
+def _write_csv(df, path):
+    """Write a DataFrame to CSV, using pyarrow's C++ writer when installed
+    
+    pyarrow is a listed requirement: its output (quoted headers, nanosecond
+    timestamps, "0" for 0.0) differs from pandas' to_csv, which is only the
+    fallback for a partial install.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pacsv
+    except ImportError:
+        df.to_csv(path, index=False)
+        return
+    
+    pacsv.write_csv(pa.Table.from_pandas(df, preserve_index=False), str(path))
+
+
+def _generate_sensor_sample():
+    """Generate 7 days of synthetic sensor data"""
+    SensorDataProcessor = _load_sensor_processor()
+    return SensorDataProcessor().generate_synthetic_sensor_data(duration_hours=168)
+
+
+def _ignore_sigint():
+    """DEM pool initializer: workers share the terminal's process group, so
+    Ctrl+C is left to the parent, which decides what to stop"""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+
+def _analyze_dem_worker(dem_path, min_area):
+    """Run the DEM risk pipeline for one file (process pool entry point)"""
+    DEMAnalyzer = _load_dem_analyzer()
+    
+    analyzer = DEMAnalyzer(dem_path)
+    
+    # Perform risk assessment
+    risk_results = analyzer.assess_rockfall_risk()
+    
+    # Identify critical zones
+    critical_zones = analyzer.identify_critical_zones(
+        risk_results, 
+        min_area=min_area
+    )
+    
+    # Create visualization
+    plot_path = analyzer.create_risk_visualization(risk_results, critical_zones)
+    
+    # Generate report
+    report = analyzer.generate_report(risk_results, critical_zones)
+    
+    return report, plot_path
 
 
 class RockfallSystem:
@@ -45,26 +256,50 @@ class RockfallSystem:
     def __init__(self):
         """Initialize the system"""
         self.setup_logging()
-        self.project_root = Path(__file__).parent
+        self.project_root = _PROJECT_ROOT
         self.running_processes = {}
         
+        # Set when a stop is requested; a running DEM sweep then submits no
+        # further files
+        self._stopping = threading.Event()
+        
         print("Initializing Rockfall Detection System")
         print("="*60)
         
     def setup_logging(self):
         """Setup system logging"""
-        log_dir = Path(__file__).parent / "outputs" / "logs"
+        log_dir = _PROJECT_ROOT / "outputs" / "logs"
         log_dir.mkdir(parents=True, exist_ok=True)
         
         log_file = log_dir / f"system_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
         
+        # Time-only timestamps keep asctime cheap; the log file name already
+        # carries the date. Rotation caps disk use of long --mode all runs.
+        formatter = logging.Formatter('%(asctime)s %(levelname).1s %(message)s', datefmt='%H:%M:%S')
+        file_handler = RotatingFileHandler(
+            log_file, maxBytes=10 * 1024 * 1024, backupCount=3, encoding='utf-8'
+        )
+        stream_handler = logging.StreamHandler()
+        file_handler.setFormatter(formatter)
+        stream_handler.setFormatter(formatter)
+        
+        # Loggers only enqueue records; a background listener thread does
+        # the formatting and file/console I/O
+        log_queue = queue.Queue(-1)
+        self.log_listener = QueueListener(
+            log_queue, file_handler, stream_handler, respect_handler_level=True
+        )
+        self.log_listener.start()
+        atexit.register(self.log_listener.stop)
+        
+        # The queue side must pass the bare message through, otherwise the
+        # record would be formatted twice
+        queue_handler = QueueHandler(log_queue)
+        queue_handler.setFormatter(logging.Formatter('%(message)s'))
+        
         logging.basicConfig(
             level=logging.INFO,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(log_file),
-                logging.StreamHandler()
-            ]
+            handlers=[queue_handler]
         )
         
         self.logger = logging.getLogger(__name__)
@@ -76,7 +311,7 @@ class RockfallSystem:
         print("-" * 40)
         
         try:
-            from src.training.train_yolo import RockfallTrainer
+            RockfallTrainer = _load_trainer()
             
             # Default training configuration
             config = {
@@ -112,7 +347,7 @@ class RockfallSystem:
         print("-" * 40)
         
         try:
-            from src.detection.realtime_detector import RockfallDetector
+            RockfallDetector = _load_detector()
             
             detector = RockfallDetector(
                 model_path=kwargs.get('model_path'),
@@ -141,7 +376,7 @@ class RockfallSystem:
         print("-" * 40)
         
         try:
-            from src.sensors.sensor_alerts import SensorDataProcessor
+            SensorDataProcessor = _load_sensor_processor()
             
             processor = SensorDataProcessor()
             
@@ -179,34 +414,29 @@ class RockfallSystem:
         print("-" * 40)
         
         try:
-            from src.dem_analysis.dem_processor import DEMAnalyzer
-            
-            analyzer = DEMAnalyzer(dem_path)
-            
-            # Perform risk assessment
-            risk_results = analyzer.assess_rockfall_risk()
-            
-            # Identify critical zones
-            critical_zones = analyzer.identify_critical_zones(
-                risk_results, 
-                min_area=kwargs.get('min_zone_size', 100)
-            )
-            
-            # Create visualization
-            plot_path = analyzer.create_risk_visualization(risk_results, critical_zones)
-            print(f"📊 Risk analysis plot saved: {plot_path}")
-            
-            # Generate report
-            report = analyzer.generate_report(risk_results, critical_zones)
+            min_area = kwargs.get('min_zone_size', 100)
+            
+            # Reuse a previous analysis of identical DEM contents
+            cache_key = _dem_cache_key(dem_path, min_area)
+            report = self._load_cached_report(cache_key)
+            
+            # Record the entry so pruning the cache keeps it
+            manifest = self._load_dem_manifest()
+            manifest[str(Path(dem_path).resolve())] = {
+                'fingerprint': _dem_fingerprint(dem_path),
+                'min_area': min_area,
+                'analyzer': _dem_analyzer_version(),
+                'cache_key': cache_key
+            }
+            self._save_dem_manifest(manifest)
             
-            # Save report
-            report_path = self.project_root / "outputs" / f"risk_report_{Path(dem_path).stem}.json"
-            with open(report_path, 'w') as f:
-                json.dump(report, f, indent=2, default=str)
+            if report is None:
+                report, plot_path = _analyze_dem_worker(dem_path, min_area)
+                self._write_report(dem_path, report, plot_path, cache_key)
+            else:
+                self._restore_cached_report(dem_path, report, cache_key)
             
-            print(f"📋 Risk report saved: {report_path}")
-            print(f"📈 High risk areas: {report['risk_distribution']['high_risk']['percentage']:.1f}%")
-            print(f"🎯 Critical zones: {len(critical_zones)}")
+            self._print_dem_summary(report)
             
             return True
             
@@ -215,8 +445,217 @@ class RockfallSystem:
             print(f"❌ DEM analysis failed: {e}")
             return False
     
-    def launch_dashboard(self, **kwargs):
-        """Launch Streamlit dashboard"""
+    def analyze_dem_files(self, dem_files, **kwargs):
+        """Analyze several DEM files in parallel worker processes"""
+        min_area = kwargs.get('min_zone_size', 100)
+        
+        # Serve cache hits in the parent; only misses are submitted. Files
+        # whose cheap fingerprint matches the manifest skip the full hash.
+        manifest = self._load_dem_manifest()
+        pending = {}
+        all_ok = True
+        for dem_file in dem_files:
+            try:
+                manifest_key = str(Path(dem_file).resolve())
+                fingerprint = _dem_fingerprint(dem_file)
+                entry = manifest.get(manifest_key)
+                
+                report = None
+                if (isinstance(entry, dict) and entry.get('cache_key')
+                        and entry.get('fingerprint') == fingerprint
+                        and entry.get('min_area') == min_area
+                        and entry.get('analyzer') == _dem_analyzer_version()):
+                    cache_key = entry['cache_key']
+                    report = self._load_cached_report(cache_key)
+                if report is None:
+                    cache_key = _dem_cache_key(dem_file, min_area)
+                    report = self._load_cached_report(cache_key)
+                
+                manifest[manifest_key] = {
+                    'fingerprint': fingerprint,
+                    'min_area': min_area,
+                    'analyzer': _dem_analyzer_version(),
+                    'cache_key': cache_key
+                }
+                
+                if report is None:
+                    pending[str(dem_file)] = cache_key
+                else:
+                    print(f"\n🗺️ Analyzing DEM: {Path(dem_file).name}")
+                    print("-" * 40)
+                    self._restore_cached_report(dem_file, report, cache_key)
+                    self._print_dem_summary(report)
+            
+            except Exception as e:
+                self.logger.error(f"DEM analysis failed for {dem_file}: {e}")
+                print(f"❌ DEM analysis failed for {Path(dem_file).name}: {e}")
+                all_ok = False
+        
+        # Entries for pending files only count as hits once their cached
+        # report has been written, so the manifest can be saved up front
+        self._save_dem_manifest(manifest)
+        
+        if not pending:
+            return all_ok
+        
+        print(f"\n📍 Analyzing {len(pending)} DEM file(s) in parallel...")
+        
+        # Spawn keeps workers clean of inherited logging handlers and threads
+        workers = min(len(pending), os.cpu_count() or 1)
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_ignore_sigint
+        ) as executor:
+            # Files are handed to the pool only as workers free up, so a stop
+            # just stops feeding it. Cancelling queued futures instead trips
+            # Python 3.11 pool bugs that leave the sweep waiting forever.
+            queued = iter(pending)
+            running = {}
+            try:
+                while True:
+                    while len(running) < workers and not self._stopping.is_set():
+                        dem_path = next(queued, None)
+                        if dem_path is None:
+                            break
+                        running[executor.submit(_analyze_dem_worker, dem_path, min_area)] = dem_path
+                    
+                    if not running:
+                        break
+                    
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        dem_path = running.pop(future)
+                        all_ok &= self._handle_dem_result(dem_path, future, pending[dem_path])
+            except KeyboardInterrupt:
+                # Called directly (--mode dem), Ctrl+C lands here; the workers
+                # ignore it, so kill them or the pool shutdown waits them out
+                self._terminate_dem_workers()
+                raise
+            
+            # Files left unanalyzed by a stop count as failures
+            if next(queued, None) is not None:
+                all_ok = False
+        
+        return all_ok
+    
+    def _handle_dem_result(self, dem_path, future, cache_key):
+        """Write out one finished DEM analysis; False if it failed"""
+        print(f"\n🗺️ DEM analysis finished: {Path(dem_path).name}")
+        print("-" * 40)
+        
+        try:
+            report, plot_path = future.result()
+            self._write_report(dem_path, report, plot_path, cache_key)
+            self._print_dem_summary(report)
+            return True
+        except Exception as e:
+            self.logger.error(f"DEM analysis failed for {dem_path}: {e}")
+            print(f"❌ DEM analysis failed: {e}")
+            return False
+    
+    def _cancel_dem_analyses(self):
+        """Stop the DEM sweep: queued files are dropped, running ones finish"""
+        self._stopping.set()
+    
+    def _terminate_dem_workers(self):
+        """Abandon the DEM sweep, killing analyses already running in workers"""
+        self._cancel_dem_analyses()
+        # The pool's workers are this process's only multiprocessing children
+        for child in multiprocessing.active_children():
+            child.terminate()
+    
+    def _load_dem_manifest(self):
+        """Load the DEM path -> fingerprint manifest (empty if missing or unreadable)"""
+        manifest_path = self.project_root / "outputs" / "cache" / "dem_manifest.json"
+        try:
+            data = manifest_path.read_bytes()
+            manifest = orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+        except (OSError, ValueError):
+            return {}
+        
+        return manifest if isinstance(manifest, dict) else {}
+    
+    def _save_dem_manifest(self, manifest):
+        """Atomically replace the DEM manifest and prune cache entries it no longer references"""
+        manifest_path = self.project_root / "outputs" / "cache" / "dem_manifest.json"
+        manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = manifest_path.with_suffix('.tmp')
+        _write_json(tmp_path, manifest)
+        tmp_path.replace(manifest_path)
+        
+        # Entries orphaned by a DEM or analyzer change are never looked up
+        # again, and each holds a multi-MB plot
+        keep = {entry.get('cache_key') for entry in manifest.values() if isinstance(entry, dict)}
+        keep.add(manifest_path.stem)
+        with os.scandir(manifest_path.parent) as entries:
+            for entry in entries:
+                if entry.name.startswith('dem_') and entry.name.rsplit('.', 1)[0] not in keep:
+                    try:
+                        os.unlink(entry.path)
+                    except OSError as e:
+                        self.logger.warning(f"Could not prune DEM cache file {entry.name}: {e}")
+    
+    def _load_cached_report(self, cache_key):
+        """Return the cached DEM report for a key, or None on a cache miss"""
+        cached_report = self.project_root / "outputs" / "cache" / f"{cache_key}.json"
+        if not cached_report.exists():
+            return None
+        
+        # A corrupt entry is recomputed (and overwritten) like any other miss
+        try:
+            with open(cached_report) as f:
+                return json.load(f)
+        except ValueError:
+            return None
+    
+    def _write_report(self, dem_path, report, plot_path, cache_key):
+        """Save a DEM report to outputs and populate the analysis cache"""
+        print(f"📊 Risk analysis plot saved: {plot_path}")
+        
+        report_path = self.project_root / "outputs" / f"risk_report_{Path(dem_path).stem}.json"
+        _write_json(report_path, report)
+        
+        print(f"📋 Risk report saved: {report_path}")
+        
+        # Populate cache; the report is written last so a partial
+        # entry is never picked up as a hit
+        cache_dir = self.project_root / "outputs" / "cache"
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        cached_report = cache_dir / f"{cache_key}.json"
+        shutil.copy(plot_path, cached_report.with_suffix('.png'))
+        tmp_report = cached_report.with_suffix('.tmp')
+        _write_json(tmp_report, report)
+        tmp_report.replace(cached_report)
+    
+    def _restore_cached_report(self, dem_path, report, cache_key):
+        """Republish a cached DEM report and its plot to outputs"""
+        print(f"♻️ Using cached analysis: {cache_key}")
+        
+        # The output plot and report may have been deleted or overwritten by
+        # another DEM with the same stem since this entry was cached
+        cached_plot = self.project_root / "outputs" / "cache" / f"{cache_key}.png"
+        if cached_plot.exists():
+            plot_path = self.project_root / "outputs" / f"risk_analysis_{Path(dem_path).stem}.png"
+            shutil.copy(cached_plot, plot_path)
+            print(f"📊 Risk analysis plot restored: {plot_path}")
+        
+        report_path = self.project_root / "outputs" / f"risk_report_{Path(dem_path).stem}.json"
+        _write_json(report_path, report)
+        
+        print(f"📋 Risk report saved: {report_path}")
+    
+    def _print_dem_summary(self, report):
+        """Print the headline figures of a DEM risk report"""
+        print(f"📈 High risk areas: {report['risk_distribution']['high_risk']['percentage']:.1f}%")
+        print(f"🎯 Critical zones: {len(report['critical_zones'])}")
+    
+    def launch_dashboard(self, detached=False, **kwargs):
+        """Launch Streamlit dashboard
+        
+        With detached=True the Streamlit process is started without waiting
+        on it and the Popen handle is returned (None on failure).
+        """
         print("\n🖥️ Launching Web Dashboard")
         print("-" * 40)
         
@@ -232,6 +671,17 @@ class RockfallSystem:
             ]
             
             print(f"🚀 Starting dashboard at http://{kwargs.get('host', 'localhost')}:{kwargs.get('port', 8501)}")
+            
+            if detached:
+                # A separate process group lets us deliver CTRL_BREAK on Windows
+                creationflags = subprocess.CREATE_NEW_PROCESS_GROUP if sys.platform == 'win32' else 0
+                # stderr stays on the console so a failed launch is visible
+                return subprocess.Popen(
+                    cmd,
+                    stdout=subprocess.DEVNULL,
+                    creationflags=creationflags
+                )
+            
             print("Press Ctrl+C to stop the dashboard")
             
             # Run in subprocess
@@ -245,85 +695,148 @@ class RockfallSystem:
         except Exception as e:
             self.logger.error(f"Dashboard launch failed: {e}")
             print(f"❌ Dashboard launch failed: {e}")
-            return False
+            return None if detached else False
     
-    def run_complete_system(self, **kwargs):
+    def _stop_dashboard(self, proc):
+        """Ask a detached dashboard process to exit and reap it"""
+        if proc is None or proc.poll() is not None:
+            return
+        
+        if sys.platform == 'win32':
+            proc.send_signal(signal.CTRL_BREAK_EVENT)
+        else:
+            proc.terminate()
+        
+        try:
+            proc.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+    
+    async def _run_dem_sweep(self):
+        """Run DEM analysis for all available files"""
+        dem_files = _list_dems(self.project_root / "data" / "DEM")
+        if dem_files:
+            return await asyncio.to_thread(self.analyze_dem_files, dem_files)
+        return True
+    
+    async def _run_sensor_task(self):
+        """Run a one-off sensor analysis"""
+        print("\n📊 Running sensor analysis...")
+        return await asyncio.to_thread(self.run_sensor_monitoring, duration=24, continuous=False)
+    
+    async def run_complete_system(self, **kwargs):
         """Run the complete integrated system"""
         print("\n🌟 Starting Complete Rockfall Detection System")
         print("="*60)
         
-        # Launch dashboard in background
-        dashboard_thread = threading.Thread(
-            target=self.launch_dashboard,
-            kwargs={'port': kwargs.get('port', 8501)}
-        )
-        dashboard_thread.daemon = True
-        dashboard_thread.start()
+        # SIGINT/SIGTERM end the run; on Windows the loop has no signal
+        # handlers and asyncio.run's own SIGINT handler cancels this task
+        stop = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        handled_signals = []
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, stop.set)
+                handled_signals.append(sig)
+            except NotImplementedError:
+                pass
         
-        print("✅ Dashboard started in background")
-        
-        # Run DEM analysis for all available files
-        dem_dir = self.project_root / "data" / "DEM"
-        if dem_dir.exists():
-            dem_files = list(dem_dir.glob("*.tif"))
-            for dem_file in dem_files:
-                print(f"\n📍 Analyzing {dem_file.name}...")
-                self.analyze_dem(str(dem_file))
-        
-        # Run sensor monitoring
-        print("\n📊 Running sensor analysis...")
-        self.run_sensor_monitoring(duration=24, continuous=False)
-        
-        # Show system status
-        print("\n" + "="*60)
-        print("🎉 System Status:")
-        print("✅ Dashboard: Running at http://localhost:8501")
-        print("✅ DEM Analysis: Completed")
-        print("✅ Sensor Monitoring: Completed")
-        print("⚠️ Video Detection: Available (start from dashboard)")
-        print("⚠️ Model Training: Available (use --mode train)")
-        print("="*60)
-        print("\n🔗 Access the dashboard to monitor the system:")
-        print("   http://localhost:8501")
-        print("\nPress Ctrl+C to stop the system")
+        # Launch dashboard in background
+        port = kwargs.get('port', 8501)
+        proc = self.launch_dashboard(port=port, detached=True)
+        if proc is not None:
+            print("✅ Dashboard started in background")
         
         try:
-            # Keep main thread alive
-            while True:
-                time.sleep(1)
-        except KeyboardInterrupt:
+            # DEM sweep and sensor analysis run side by side
+            work = asyncio.gather(self._run_dem_sweep(), self._run_sensor_task(),
+                                  return_exceptions=True)
+            stop_wait = asyncio.ensure_future(stop.wait())
+            await asyncio.wait({work, stop_wait}, return_when=asyncio.FIRST_COMPLETED)
+            
+            if stop.is_set():
+                # A repeated signal now interrupts (KeyboardInterrupt) instead
+                # of being absorbed by the handler
+                for sig in handled_signals:
+                    loop.remove_signal_handler(sig)
+                
+                # Queued DEM files are dropped; analyses already running in
+                # threads or workers are waited for here, where a second
+                # Ctrl+C cancels this task and abandons them
+                self._cancel_dem_analyses()
+                print("\n🛑 Stopping: finishing analyses in progress (Ctrl+C again to abandon them)")
+                await asyncio.gather(work, return_exceptions=True)
+            else:
+                completed = {}
+                for name, result in zip(("DEM Analysis", "Sensor Monitoring"), work.result()):
+                    if isinstance(result, Exception):
+                        self.logger.error(f"{name} failed: {result}")
+                    completed[name] = result is True
+                
+                # The dashboard may have exited since launch (streamlit
+                # missing, port in use)
+                dashboard_up = proc is not None and proc.poll() is None
+                
+                # Show system status
+                print("\n" + "="*60)
+                print("🎉 System Status:")
+                if dashboard_up:
+                    print(f"✅ Dashboard: Running at http://localhost:{port}")
+                else:
+                    print("❌ Dashboard: Not running (see errors above)")
+                for name, ok in completed.items():
+                    print(f"✅ {name}: Completed" if ok else f"❌ {name}: Failed")
+                print("⚠️ Video Detection: Available (start from dashboard)")
+                print("⚠️ Model Training: Available (use --mode train)")
+                print("="*60)
+                if dashboard_up:
+                    print("\n🔗 Access the dashboard to monitor the system:")
+                    print(f"   http://localhost:{port}")
+                print("\nPress Ctrl+C to stop the system")
+                
+                await stop_wait
+                for sig in handled_signals:
+                    loop.remove_signal_handler(sig)
+            
             print("\n🛑 System stopped by user")
+        except (asyncio.CancelledError, KeyboardInterrupt):
+            # Without loop signal handlers Ctrl+C cancels the task mid-sweep;
+            # stop feeding the pool and kill running analyses so the sweep
+            # thread exits instead of holding up asyncio.run's shutdown
+            self._terminate_dem_workers()
+            raise
+        finally:
+            await asyncio.to_thread(self._stop_dashboard, proc)
         
         return True
     
-    def create_sample_data(self):
-        """Create sample data files for testing"""
-        print("\n📂 Creating sample data files")
-        print("-" * 40)
-        
-        sample_dir = self.project_root / "sample_data"
-        
-        # Create sensor data
+    async def _create_sensor_sample(self, sensor_file):
+        """Generate a week of synthetic sensor data and save it as CSV"""
         print("📊 Generating sample sensor data...")
         try:
-            from src.sensors.sensor_alerts import SensorDataProcessor
-            processor = SensorDataProcessor()
-            
-            # Generate 7 days of data
-            df = processor.generate_synthetic_sensor_data(duration_hours=168)
-            
-            sensor_file = sample_dir / "sensor_data" / "sample_sensor_data.csv"
-            sensor_file.parent.mkdir(parents=True, exist_ok=True)
-            df.to_csv(sensor_file, index=False)
+            # Importing the sensor stack is slow too, so it stays off the loop
+            df = await asyncio.to_thread(_generate_sensor_sample)
+            await asyncio.to_thread(_write_csv, df, sensor_file)
             
             print(f"✅ Sample sensor data saved: {sensor_file}")
             
         except Exception as e:
             print(f"❌ Failed to create sensor data: {e}")
+    
+    async def create_sample_data(self):
+        """Create sample data files for testing"""
+        print("\n📂 Creating sample data files")
+        print("-" * 40)
         
-        # Create weather data
+        sample_dir = self.project_root / "sample_data"
+        sensor_file = sample_dir / "sensor_data" / "sample_sensor_data.csv"
         weather_file = sample_dir / "weather_data" / "sample_weather.json"
-        weather_file.parent.mkdir(parents=True, exist_ok=True)
+        
+        await asyncio.gather(
+            asyncio.to_thread(sensor_file.parent.mkdir, parents=True, exist_ok=True),
+            asyncio.to_thread(weather_file.parent.mkdir, parents=True, exist_ok=True)
+        )
         
         sample_weather = {
             "timestamp": datetime.now().isoformat(),
@@ -335,8 +848,11 @@ class RockfallSystem:
             "weather_condition": "partly_cloudy"
         }
         
-        with open(weather_file, 'w') as f:
-            json.dump(sample_weather, f, indent=2)
+        # The sensor and weather files are independent; write them concurrently
+        await asyncio.gather(
+            self._create_sensor_sample(sensor_file),
+            _write_json_async(weather_file, sample_weather)
+        )
         
         print(f"✅ Sample weather data saved: {weather_file}")
         
@@ -395,7 +911,7 @@ def main():
     
     try:
         if args.mode == 'setup':
-            system.create_sample_data()
+            asyncio.run(system.create_sample_data())
             
         elif args.mode == 'train':
             system.train_model(
@@ -424,11 +940,9 @@ def main():
                 system.analyze_dem(args.dem_path)
             else:
                 # Analyze all DEM files
-                dem_dir = Path("data/DEM")
-                if dem_dir.exists():
-                    dem_files = list(dem_dir.glob("*.tif"))
-                    for dem_file in dem_files:
-                        system.analyze_dem(str(dem_file))
+                dem_files = _list_dems(Path("data/DEM"))
+                if dem_files:
+                    system.analyze_dem_files(dem_files)
                 else:
                     print("❌ No DEM files found. Use --dem-path to specify a file.")
                     
@@ -439,9 +953,9 @@ def main():
             )
             
         elif args.mode == 'all':
-            system.run_complete_system(
+            asyncio.run(system.run_complete_system(
                 port=args.port
-            )
+            ))
             
     except KeyboardInterrupt:
         print("\n🛑 System interrupted by user")
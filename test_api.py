@@ -3,10 +3,22 @@
 Simple test script to verify the rock detection API is working.
 """
 
-import requests
+import json
 import os
+import urllib3
 from pathlib import Path
 
+API_BASE_URL = "http://localhost:8000"
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+# A single keep-alive pool, without the requests session machinery
+http = urllib3.PoolManager(
+    num_pools=1,
+    maxsize=4,
+    retries=False,
+    timeout=urllib3.Timeout(connect=3, read=30)
+)
+
 def test_api():
     """Test the rock detection API with a sample image."""
     # Find a test image
@@ -25,43 +37,82 @@ def test_api():
     test_image = test_images[0]
     print(f"🔍 Testing with image: {test_image.name}")
     
+    if not _check_status():
+        return False
+    
+    return _check_detection(test_image)
+
+def _check_status():
+    """Verify the API status endpoint responds."""
     try:
         # Test API status first
         print("📡 Testing API status...")
-        status_response = requests.get("http://localhost:8000/api/status", timeout=10)
-        if status_response.status_code == 200:
+        status_response = http.request(
+            "GET", f"{API_BASE_URL}/api/status",
+            timeout=urllib3.Timeout(connect=3, read=10)
+        )
+        if status_response.status == 200:
             print("✅ API status check passed")
-            print(f"Status: {status_response.json()}")
+            print(f"Status: {json.loads(status_response.data)}")
+            return True
         else:
-            print(f"❌ API status check failed: {status_response.status_code}")
+            print(f"❌ API status check failed: {status_response.status}")
             return False
             
-    except requests.exceptions.ConnectionError:
+    except urllib3.exceptions.NewConnectionError:
         print("❌ Cannot connect to API server. Is it running on port 8000?")
         return False
     except Exception as e:
         print(f"❌ Error checking API status: {e}")
         return False
+
+def _multipart_file_upload(field, path, content_type):
+    """Build headers and a streamed multipart/form-data body for one file.
+    
+    The file is sent in UPLOAD_CHUNK_SIZE pieces rather than being read
+    into memory and copied into an encoded body first.
+    """
+    boundary = urllib3.filepost.choose_boundary()
+    head = (
+        f'--{boundary}\r\n'
+        f'Content-Disposition: form-data; name="{field}"; filename="{path.name}"\r\n'
+        f'Content-Type: {content_type}\r\n\r\n'
+    ).encode()
+    tail = f'\r\n--{boundary}--\r\n'.encode()
     
+    def chunks():
+        yield head
+        with open(path, 'rb') as f:
+            while chunk := f.read(UPLOAD_CHUNK_SIZE):
+                yield chunk
+        yield tail
+    
+    headers = {
+        'Content-Type': f'multipart/form-data; boundary={boundary}',
+        'Content-Length': str(len(head) + os.path.getsize(path) + len(tail))
+    }
+    return headers, chunks()
+
+def _check_detection(test_image):
+    """Upload a test image to the rock detection endpoint."""
     try:
         # Test rock detection
         print("🪨 Testing rock detection...")
-        with open(test_image, 'rb') as f:
-            files = {'file': (test_image.name, f, 'image/jpeg')}
-            response = requests.post(
-                "http://localhost:8000/api/detect-rocks",
-                files=files,
-                timeout=30
-            )
+        headers, body = _multipart_file_upload('file', test_image, 'image/jpeg')
+        response = http.request(
+            "POST", f"{API_BASE_URL}/api/detect-rocks",
+            body=body,
+            headers=headers
+        )
         
-        if response.status_code == 200:
-            results = response.json()
+        if response.status == 200:
+            results = json.loads(response.data)
             print("✅ Rock detection API test passed!")
             print(f"Results: {results}")
             return True
         else:
-            print(f"❌ Rock detection API failed: {response.status_code}")
-            print(f"Response: {response.text}")
+            print(f"❌ Rock detection API failed: {response.status}")
+            print(f"Response: {response.data.decode(errors='replace')}")
             return False
             
     except Exception as e:
@@ -10,8 +10,75 @@ and can be processed by the backend system.
 import cv2
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
+# Capture properties reported by the test, read in one go per file
+VIDEO_PROPERTIES = (
+    ('fps', cv2.CAP_PROP_FPS),
+    ('frame_count', cv2.CAP_PROP_FRAME_COUNT),
+    ('width', cv2.CAP_PROP_FRAME_WIDTH),
+    ('height', cv2.CAP_PROP_FRAME_HEIGHT)
+)
+
+def _props(cap):
+    """Read the reported capture properties of an open video"""
+    return {name: cap.get(prop) for name, prop in VIDEO_PROPERTIES}
+
+def _probe(video_path, camera_name):
+    """Open a video file and collect the properties checked by the test"""
+    result = {
+        'camera_name': camera_name,
+        'video_path': video_path,
+        'exists': video_path.exists(),
+        'opened': False
+    }
+    
+    if not result['exists']:
+        return result
+    
+    # Test with OpenCV
+    cap = cv2.VideoCapture(str(video_path))
+    
+    if not cap.isOpened():
+        return result
+    
+    result['opened'] = True
+    
+    # Get video properties
+    props = _props(cap)
+    fps = props['fps']
+    frame_count = int(props['frame_count'])
+    result['fps'] = fps
+    result['frame_count'] = frame_count
+    result['duration'] = frame_count / fps if fps > 0 else 0
+    result['width'] = int(props['width'])
+    result['height'] = int(props['height'])
+    
+    # Test reading a few frames; grab() skips the colour conversion of
+    # frames we never look at, only the last one is fully retrieved.
+    # Short or broken files never ask for frames they don't have.
+    frames_read = 0
+    for i in range(min(10, frame_count)):  # Test first 10 frames
+        if not cap.grab():
+            break
+        frames_read += 1
+    if frames_read:
+        ret, frame = cap.retrieve()
+        frames_read -= int(not ret)
+    result['frames_read'] = frames_read
+    
+    # Test looping (go back to start)
+    cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+    result['loop_ok'] = cap.grab()
+    
+    cap.release()
+    
+    # File size check
+    result['size_mb'] = video_path.stat().st_size / (1024 * 1024)  # MB
+    
+    return result
+
 def test_video_files():
     """Test the video files in data/camera_data/"""
     
@@ -35,67 +102,49 @@ def test_video_files():
     
     all_tests_passed = True
     
-    for video_file in video_files:
-        video_path = video_dir / video_file
-        camera_name = camera_mapping[video_file]
-        
-        print(f"\n📹 Testing {camera_name} ({video_file}):")
-        print("-" * 30)
-        
-        if not video_path.exists():
-            print(f"❌ File not found: {video_path}")
-            all_tests_passed = False
-            continue
-        
-        # Test with OpenCV
-        cap = cv2.VideoCapture(str(video_path))
-        
-        if not cap.isOpened():
-            print(f"❌ Cannot open video file: {video_path}")
-            all_tests_passed = False
-            continue
-        
-        # Get video properties
-        fps = cap.get(cv2.CAP_PROP_FPS)
-        frame_count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
-        duration = frame_count / fps if fps > 0 else 0
-        width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
-        height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+    # Decoding is I/O bound and OpenCV releases the GIL, so probe all files at once
+    with ThreadPoolExecutor(max_workers=len(video_files)) as executor:
+        futures = [
+            executor.submit(_probe, video_dir / video_file, camera_mapping[video_file])
+            for video_file in video_files
+        ]
         
-        print(f"✅ Successfully opened video")
-        print(f"   📊 Duration: {duration:.1f} seconds")
-        print(f"   🎞️  FPS: {fps:.1f}")
-        print(f"   📏 Resolution: {width}x{height}")
-        print(f"   🖼️  Frame Count: {frame_count}")
-        
-        # Test reading a few frames
-        frames_read = 0
-        for i in range(10):  # Test first 10 frames
-            ret, frame = cap.read()
-            if ret:
-                frames_read += 1
+        for future in as_completed(futures):
+            result = future.result()
+            video_path = result['video_path']
+            
+            print(f"\n📹 Testing {result['camera_name']} ({video_path.name}):")
+            print("-" * 30)
+            
+            if not result['exists']:
+                print(f"❌ File not found: {video_path}")
+                all_tests_passed = False
+                continue
+            
+            if not result['opened']:
+                print(f"❌ Cannot open video file: {video_path}")
+                all_tests_passed = False
+                continue
+            
+            duration = result['duration']
+            
+            print(f"✅ Successfully opened video")
+            print(f"   📊 Duration: {duration:.1f} seconds")
+            print(f"   🎞️  FPS: {result['fps']:.1f}")
+            print(f"   📏 Resolution: {result['width']}x{result['height']}")
+            print(f"   🖼️  Frame Count: {result['frame_count']}")
+            print(f"   ✅ Successfully read {result['frames_read']}/10 test frames")
+            
+            if result['loop_ok']:
+                print(f"   ✅ Video looping works correctly")
             else:
-                break
-        
-        print(f"   ✅ Successfully read {frames_read}/10 test frames")
-        
-        # Test looping (go back to start)
-        cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
-        ret, frame = cap.read()
-        if ret:
-            print(f"   ✅ Video looping works correctly")
-        else:
-            print(f"   ❌ Video looping failed")
-            all_tests_passed = False
-        
-        cap.release()
-        
-        # File size check
-        file_size = video_path.stat().st_size / (1024 * 1024)  # MB
-        print(f"   💾 File Size: {file_size:.1f} MB")
-        
-        if duration < 7 or duration > 9:
-            print(f"   ⚠️  Warning: Duration {duration:.1f}s is not close to 8 seconds")
+                print(f"   ❌ Video looping failed")
+                all_tests_passed = False
+            
+            print(f"   💾 File Size: {result['size_mb']:.1f} MB")
+            
+            if duration < 7 or duration > 9:
+                print(f"   ⚠️  Warning: Duration {duration:.1f}s is not close to 8 seconds")
     
     print("\n" + "=" * 50)
     if all_tests_passed: